@@ -1,3 +1,4 @@
+from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -12,6 +13,10 @@ class CartService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _get_menu_item(self, menu_item_id: int) -> Optional[MenuItem]:
+        """Get a menu item by id, or None if it doesn't exist"""
+        return self.db.get(MenuItem, menu_item_id)
+
     def get_or_create_cart(self, user_id: int) -> ShoppingCart:
         """Get the user's cart or create one if it doesn't exist"""
         try:
@@ -32,7 +37,7 @@ class CartService:
         """Add an item to the cart"""
         try:
             # Verify menu item exists
-            menu_item = self.db.query(MenuItem).get(item_data.menu_item_id)
+            menu_item = self._get_menu_item(item_data.menu_item_id)
             if not menu_item:
                 raise ValueError(f"Menu item {item_data.menu_item_id} not found")
             if not menu_item.is_available:
@@ -144,7 +149,7 @@ class CartService:
             total = 0.0
 
             for item in cart.items:
-                menu_item = self.db.query(MenuItem).get(item.menu_item_id)
+                menu_item = self._get_menu_item(item.menu_item_id)
                 if menu_item:
                     total += menu_item.price * item.quantity
 
@@ -2,10 +2,11 @@ import os
 os.environ["TESTING"] = "1"  # Set testing environment before any imports
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from datetime import timedelta
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
-from pathlib import Path
 from backend.utils.database import SessionLocal, init_db, Base, engine, get_db
 
 from backend.api.app import app
@@ -16,74 +17,87 @@ from backend.models.orm.rating import MenuItemRating, RestaurantFeedback
 from backend.utils.auth import create_access_token
 from httpx import AsyncClient
 
-# Get the absolute path to the backend directory
-BACKEND_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-BACKEND_DIR = BACKEND_DIR / "backend"
+# Use an in-memory SQLite database; each pytest-xdist worker process gets its own
+TEST_DATABASE_URL = "sqlite+pysqlite:///:memory:"
 
-# Ensure test database directory exists
-db_path = BACKEND_DIR / "database"
-db_path.mkdir(parents=True, exist_ok=True)
-
-# Use a separate test database with absolute path
-TEST_DATABASE_URL = f"sqlite:///{db_path}/test.db"
-
-# Create test engine
+# Create test engine. StaticPool hands every caller the same connection, so the
+# TestClient's worker thread sees the same in-memory database as the tests.
 test_engine = create_engine(
     TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Allow SQLite to be used across threads
+    connect_args={"check_same_thread": False},  # Allow SQLite to be used across threads
+    poolclass=StaticPool,
+    query_cache_size=1200  # Keep every statement shape the suite uses in the compiled cache
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+# Rows seeded once per session and shared by every test
+BASELINE_USERS = [
+    {
+        "username": "baseline_user",
+        "email": "baseline@example.com",
+        "password_hash": "hashed_password",
+        "first_name": "Test",
+        "last_name": "User",
+        "role": "customer"
+    },
+]
+
+@event.listens_for(test_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite"""
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(test_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
 @pytest.fixture(scope="session", autouse=True)
 def initialize_database():
-    """Initialize the database before running tests"""
-    # Drop all tables and recreate them
-    Base.metadata.drop_all(bind=test_engine)
+    """Create the schema and seed baseline rows once per test session"""
     Base.metadata.create_all(bind=test_engine)
 
-def override_get_db():
-    """Override the get_db dependency for testing"""
-    db = TestingSessionLocal()
+    session = TestingSessionLocal(expire_on_commit=False)
     try:
-        yield db
-    finally:
-        db.close()
-
-@pytest.fixture(autouse=True)
-def cleanup_database():
-    """Clean up database before each test"""
-    session = TestingSessionLocal()
-    try:
-        for table in reversed(Base.metadata.sorted_tables):
-            session.execute(table.delete())
+        # A single executemany INSERT ... RETURNING for all baseline rows
+        users = session.scalars(insert(User).returning(User), BASELINE_USERS).all()
         session.commit()
     finally:
         session.close()
-    yield
+    yield {"user": users[0]}
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
 def db_session():
-    """Get a database session for each test"""
-    db = TestingSessionLocal()
+    """Get a database session for each test, rolled back when the test finishes"""
+    # Commits inside the test only release a SAVEPOINT; the outer transaction
+    # is rolled back at teardown. API requests share this session via get_db.
+    connection = test_engine.connect()
+    trans = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+    app.dependency_overrides[get_db] = lambda: session
     try:
-        yield db
+        yield session
     finally:
-        db.close()
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+        trans.rollback()
+        connection.close()
 
-@pytest.fixture
-def client(db_session):
-    """Get a test client"""
-    app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session")
+def client():
+    """Get a test client shared by all tests in the session (one per xdist worker)"""
+    # Not entered as a context manager: that would run the app's startup event,
+    # whose init_db() creates tables on the app's real DATABASE_URL engine.
     yield TestClient(app)
-    app.dependency_overrides.clear()
 
 @pytest.fixture
 async def async_client(db_session):
     """Create an async test client"""
-    app.dependency_overrides[get_db] = lambda: db_session
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
-    app.dependency_overrides.clear()
 
 @pytest.fixture
 def sample_category(db_session):
@@ -125,21 +139,15 @@ def sample_menu_item(db_session, sample_category):
     db_session.refresh(menu_item)
     return menu_item
 
+@pytest.fixture(scope="session")
+def test_user_session(initialize_database):
+    """The baseline test user seeded once per session (detached instance)."""
+    return initialize_database["user"]
+
 @pytest.fixture
-def test_user(db_session):
-    """Create a test user for testing."""
-    user = User(
-        username="testuser",
-        email="test@example.com",
-        password_hash="hashed_password",
-        first_name="Test",
-        last_name="User",
-        role="customer"
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+def test_user(db_session, test_user_session):
+    """The baseline test user, attached to the current test's session."""
+    return db_session.get(User, test_user_session.id)
 
 @pytest.fixture
 def sample_cart(db_session, test_user):
@@ -233,23 +241,27 @@ def test_cart_item(db_session, test_cart, test_menu_item):
     db_session.refresh(cart_item)
     return cart_item
 
+@pytest.fixture(scope="session")
+def test_user_token(test_user_session):
+    """Create a JWT token for the test user, signed once per session"""
+    # Outlive the default 30 minute expiry so long runs don't see a stale token
+    return create_access_token(
+        data={"sub": test_user_session.email},
+        expires_delta=timedelta(hours=12)
+    )
+
 @pytest.fixture
-def test_user_token(db_session):
-    """Create a JWT token for the test user"""
-    from backend.services.user_service import UserService
-    from backend.models.schemas.user import UserCreate
-    
-    # Create a test user with proper password hashing
-    user_service = UserService(db_session)
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="testpass123",
-        first_name="Test",
-        last_name="User",
-        role="customer"
+def seeded_rating(client, test_user_token, test_menu_item):
+    """Create a menu item rating through the API and return the created rating"""
+    rating_data = {
+        "menu_item_id": test_menu_item.id,
+        "rating": 4,
+        "comment": "Seeded rating"
+    }
+    response = client.post(
+        f"/api/ratings/menu-items/{test_menu_item.id}",
+        json=rating_data,
+        headers={"Authorization": f"Bearer {test_user_token}"}
     )
-    user = user_service.create_user(user_data)
-    
-    # Create and return the token
-    return create_access_token(data={"sub": user.email})
\ No newline at end of file
+    assert response.status_code == 200
+    return response.json()
@@ -1,8 +1,12 @@
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 from backend.services.cart_service import CartService
 from backend.models.schemas.cart import CartItemCreate, CartItemUpdate
 
+pytestmark = [pytest.mark.integration, pytest.mark.cart]
+
 def test_get_or_create_cart(db_session, test_user):
     service = CartService(db_session)
     cart = service.get_or_create_cart(test_user.id)
@@ -68,23 +72,15 @@ def test_add_unavailable_menu_item(db_session, test_user, sample_menu_item):
     with pytest.raises(ValueError, match="Menu item .* is not available"):
         service.add_item(test_user.id, item_data)
 
-def test_update_cart_item(db_session, test_user, sample_menu_item):
+def test_update_cart_item(db_session, test_user, sample_cart_item):
     service = CartService(db_session)
-    item_data = CartItemCreate(
-        menu_item_id=sample_menu_item.id,
-        quantity=2
-    )
-    
-    cart = service.add_item(test_user.id, item_data)
-    cart_item = cart.items[0]
-    
     update_data = CartItemUpdate(
         quantity=3,
         customizations={"notes": "Less spicy"}
     )
     
-    updated_cart = service.update_item(test_user.id, cart_item.id, update_data)
-    updated_item = next(item for item in updated_cart.items if item.id == cart_item.id)
+    updated_cart = service.update_item(test_user.id, sample_cart_item.id, update_data)
+    updated_item = next(item for item in updated_cart.items if item.id == sample_cart_item.id)
     assert updated_item.quantity == 3
     assert updated_item.customizations == {"notes": "Less spicy"}
 
@@ -95,31 +91,15 @@ def test_update_nonexistent_cart_item(db_session, test_user):
     with pytest.raises(ValueError, match="Cart item .* not found"):
         service.update_item(test_user.id, 999, update_data)
 
-def test_update_cart_item_zero_quantity(db_session, test_user, sample_menu_item):
+def test_update_cart_item_zero_quantity(db_session, test_user, sample_cart_item):
     service = CartService(db_session)
-    item_data = CartItemCreate(
-        menu_item_id=sample_menu_item.id,
-        quantity=2
-    )
-    
-    cart = service.add_item(test_user.id, item_data)
-    cart_item = cart.items[0]
-    
     update_data = CartItemUpdate(quantity=0)
-    updated_cart = service.update_item(test_user.id, cart_item.id, update_data)
+    updated_cart = service.update_item(test_user.id, sample_cart_item.id, update_data)
     assert len(updated_cart.items) == 0
 
-def test_remove_item_from_cart(db_session, test_user, sample_menu_item):
+def test_remove_item_from_cart(db_session, test_user, sample_cart_item):
     service = CartService(db_session)
-    item_data = CartItemCreate(
-        menu_item_id=sample_menu_item.id,
-        quantity=2
-    )
-    
-    cart = service.add_item(test_user.id, item_data)
-    cart_item = cart.items[0]
-    
-    updated_cart = service.remove_item(test_user.id, cart_item.id)
+    updated_cart = service.remove_item(test_user.id, sample_cart_item.id)
     assert len(updated_cart.items) == 0
 
 def test_remove_nonexistent_cart_item(db_session, test_user):
@@ -127,20 +107,8 @@ def test_remove_nonexistent_cart_item(db_session, test_user):
     with pytest.raises(ValueError, match="Cart item .* not found"):
         service.remove_item(test_user.id, 999)
 
-def test_clear_cart(db_session, test_user, sample_menu_item):
+def test_clear_cart(db_session, test_user, sample_cart_item):
     service = CartService(db_session)
-    item_data1 = CartItemCreate(
-        menu_item_id=sample_menu_item.id,
-        quantity=2
-    )
-    item_data2 = CartItemCreate(
-        menu_item_id=sample_menu_item.id,
-        quantity=1
-    )
-    
-    service.add_item(test_user.id, item_data1)
-    service.add_item(test_user.id, item_data2)
-    
     cart = service.clear_cart(test_user.id)
     assert len(cart.items) == 0
 
@@ -155,13 +123,15 @@ def test_calculate_total(db_session, test_user, sample_menu_item):
     total = service.calculate_total(test_user.id)
     assert total == sample_menu_item.price * 2
 
-def test_database_error_handling(db_session, test_user):
-    service = CartService(db_session)
-    
-    # Force a database error by expiring and closing the session
-    db_session.expire_all()
-    db_session.bind.dispose()
-    db_session.close()
-    
-    with pytest.raises(SQLAlchemyError):
-        service.get_or_create_cart(test_user.id)
+def test_database_error_handling():
+    # Use a throwaway engine with no schema so the shared test engine stays intact
+    bad_engine = create_engine("sqlite://")
+    bad_session = Session(bind=bad_engine)
+    service = CartService(bad_session)
+
+    try:
+        with pytest.raises(SQLAlchemyError):
+            service.get_or_create_cart(1)
+    finally:
+        bad_session.close()
+        bad_engine.dispose()
@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from backend.models.schemas.rating import RestaurantFeedbackCreate
+
+def test_whitespace_only_feedback_text_rejected():
+    """Feedback text made only of whitespace fails the feedback_not_empty validator"""
+    with pytest.raises(ValidationError) as exc_info:
+        RestaurantFeedbackCreate(
+            feedback_text="   ",
+            service_rating=5,
+            ambiance_rating=4,
+            cleanliness_rating=5,
+            value_rating=4
+        )
+    assert "Feedback text cannot be empty" in str(exc_info.value)